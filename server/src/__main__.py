@@ -1,4 +1,5 @@
 import argparse
+import os
 import sys
 import traceback
 
@@ -10,7 +11,7 @@ Logger.show_threads_name()
 Logger.set_module("App.Main")
 
 
-BASE_PATH = __file__[:__file__.rfind('/')]  # get the base path of the server
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))  # get the base path of the server
 
 
 parser = argparse.ArgumentParser(description="Start the application.")
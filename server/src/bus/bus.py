@@ -5,9 +5,9 @@ from typing import Any, Callable
 import traceback
 import random
 
-from gamuLogger import Logger
+from gamuLogger import Levels, Logger
 
-from ..utils.misc import is_types_equals
+from ..utils.misc import is_level_enabled, is_types_equals
 from .bus_data import BusData, BusMessagePrefix
 from .events import FILE_SEPARATOR, EncodedEvent, Event, Events
 
@@ -126,7 +126,8 @@ class Bus:
                                   fragment_number=fragment_number,
                                   fragment_count=fragment_count)
         encoded_str = self.__add_prefix(raw_msg, prefix)
-        Logger.trace(f"Writing message (with prefix) to bus: {' '.join(format(ord(c), '02X') for c in encoded_str)} (Length: {len(encoded_str)} bytes)")
+        if is_level_enabled(Levels.TRACE):
+            Logger.trace(f"Writing message (with prefix) to bus: {' '.join(format(ord(c), '02X') for c in encoded_str)} (Length: {len(encoded_str)} bytes)")
 
         if len(encoded_str) > self.__max_string_length:
             raise ValueError(f"Encoded event data exceeds memory size limit: {len(encoded_str)} bytes > {self.__max_string_length} bytes")
@@ -149,8 +150,11 @@ class Bus:
 
         # if len(encoded) > self.__max_string_length:
         #     raise ValueError(f"Encoded event data exceeds memory size limit: {len(encoded)} bytes > {self.__max_string_length} bytes")
-        Logger.debug(f"Triggering event {event.name} with arguments: {kwargs}")
-        Logger.trace(f"Raw data: {encoded} (Length: {len(encoded)} bytes)")
+        # kwargs and the encoded data can be large (version lists, server infos...), only format them if printed
+        if is_level_enabled(Levels.DEBUG):
+            Logger.debug(f"Triggering event {event.name} with arguments: {kwargs}")
+            if is_level_enabled(Levels.TRACE):
+                Logger.trace(f"Raw data: {encoded} (Length: {len(encoded)} bytes)")
         if len(encoded) + BusMessagePrefix.length() <= self.__max_string_length:
             parts = [encoded.string()]
         else:
@@ -166,7 +170,8 @@ class Bus:
         if event.return_type != "None":
             res = self.wait_for(event.return_event(), timeout=timeout)  # Wait for the event to be processed and return the result
             res = res['result'] if res is not None else None
-            Logger.debug(f"Event {event.name} returned: {res}")
+            if is_level_enabled(Levels.DEBUG):
+                Logger.debug(f"Event {event.name} returned: {res}")
             return res
         # res['result'] is of the type specified in the event's <return type="..." /> tag
         # or None if the timeout is reached or the event is not triggered
@@ -221,14 +226,19 @@ class Bus:
             except TypeError:
                 continue
             if msg != self.__empty_string:
-                Logger.trace(f"Processing message: {msg}")
+                trace_enabled = is_level_enabled(Levels.TRACE)
+                if trace_enabled:
+                    Logger.trace(f"Processing message: {msg}")
                 try:
                     event, args = Event.decode(msg)
-                    Logger.debug(f"Received message: {event} with args: {args}")
-                    Logger.trace(f"Raw data: {msg} (Length: {len(msg)} bytes)")
+                    if is_level_enabled(Levels.DEBUG):
+                        Logger.debug(f"Received message: {event} with args: {args}")
+                    if trace_enabled:
+                        Logger.trace(f"Raw data: {msg} (Length: {len(msg)} bytes)")
                 except Exception as e:
                     Logger.error(f"Error decoding message {msg}: {e.__class__.__name__} : {e}")
-                    Logger.debug(traceback.format_exc())
+                    if is_level_enabled(Levels.DEBUG): # formatting the traceback walks the stack and reads the sources
+                        Logger.debug(traceback.format_exc())
                     continue
                 try:
                     if event.id in self.__subscribers:
@@ -237,23 +247,29 @@ class Bus:
                                 self.__exec_callback(event, prefix.source_id, **args)
                             except Exception as e:
                                 Logger.error(f"Error processing event {event.name} with args {args}: {e.__class__.__name__} : {e}")
-                                Logger.debug(traceback.format_exc())
+                                if is_level_enabled(Levels.DEBUG):
+                                    Logger.debug(traceback.format_exc())
                         t = th.Thread(target=a, daemon=True, name=f"BusCB-{event.name}")
-                        Logger.trace(f"Starting thread for event {event.name} with args {args}\nthread hash: {t.__hash__()}\nthread name: {t.name}")
+                        if trace_enabled:
+                            Logger.trace(f"Starting thread for event {event.name} with args {args}\nthread hash: {t.__hash__()}\nthread name: {t.name}")
                         t.start()
                     else:
                         Logger.debug(f"No subscribers for event {event.name}, skipping processing.")
-                        Logger.trace(f"List of current subscribers:\n{'\n'.join(f"{Events.get_event(event).name} ({event}): {', '.join(callback.__name__ for callback in callbacks)}" for event, callbacks in self.__subscribers.items())}")
+                        if trace_enabled:
+                            Logger.trace(f"List of current subscribers:\n{'\n'.join(f"{Events.get_event(event).name} ({event}): {', '.join(callback.__name__ for callback in callbacks)}" for event, callbacks in self.__subscribers.items())}")
                 except Exception as e:
                     Logger.error(f"Error processing message {event} with {args}: {e.__class__.__name__} : {e}")
             time.sleep(0.01)
         Logger.info("Bus listening stopped")
 
     def __exec_callback(self, event : Event, source_id : int, **args: Any) -> Any:
+        debug_enabled = is_level_enabled(Levels.DEBUG)
         for callback in self.__subscribers[event.id]:
-            Logger.debug(f"Processing message {event} with callback {callback.__name__} and args {args}")
+            if debug_enabled:
+                Logger.debug(f"Processing message {event} with callback {callback.__name__} and args {args}")
             result = callback(**args)
-            Logger.debug(f"Callback {callback.__name__} returned: {result}")
+            if debug_enabled:
+                Logger.debug(f"Callback {callback.__name__} returned: {result}")
             if result is not None and event.return_type != "None":
                 self.__send(event.return_event(), source_id, result=result) # Send the result back to the source
                 break  # Stop after the first callback that returns a non-None value
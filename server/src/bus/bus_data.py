@@ -26,6 +26,8 @@ class BusMessagePrefix:
     """
     Class to hold the prefix for bus messages.
     """
+    __slots__ = ("source_id", "target_id", "fragment_number", "fragment_count", "message_id") # one instance per message fragment
+
     def __init__(self, source_id: int, target_id: int, fragment_number: int, fragment_count: int, message_id: int):
         self.source_id = source_id
         self.target_id = target_id
@@ -5,8 +5,9 @@ from multiprocessing.managers import SharedMemoryManager
 from random import randint
 import traceback
 
-from gamuLogger import Logger
+from gamuLogger import Levels, Logger
 
+from ..utils.misc import is_level_enabled
 from .bus_data import BusData, BusMessagePrefix
 from .events import FILE_SEPARATOR, EncodedEvent
 
@@ -122,30 +123,37 @@ class BusDispatcher:
                     msg = EncodedEvent(rec_bus_data.write_list[0])
                 if msg.string() == self.__empty_string:
                     continue
-                Logger.debug(f"Processing messages from {rec_key}: {msg}")
+                debug_enabled = is_level_enabled(Levels.DEBUG)
+                trace_enabled = is_level_enabled(Levels.TRACE)
+                if debug_enabled:
+                    Logger.debug(f"Processing messages from {rec_key}: {msg}")
                 try:
                     for key, bus_data in self.__bus_datas.items():
                         if key == rec_key: # Skip the same key
                             continue
                         _, target_id = self.__get_source_target(msg)
                         if target_id not in (0, self.__ids[key]):
-                            Logger.debug(f"Message {msg} not for {key}, skipping.")
+                            if debug_enabled:
+                                Logger.debug(f"Message {msg} not for {key}, skipping.")
                             continue
-                        Logger.debug(f"Forwarding message {msg} to {key}")
+                        if debug_enabled:
+                            Logger.debug(f"Forwarding message {msg} to {key}")
                         with bus_data.read_list_lock:
                             # Find the first empty slot in the read list
                             for i in range(len(bus_data.read_list)):
                                 if bus_data.read_list[i] == self.__empty_string:
                                     bus_data.read_list[i] = msg.string()
-                                    Logger.trace(f"Message {msg} forwarded to {key} at index {i}")
-                                    Logger.trace(f"Current read list for {key}:\n{'\n'.join(str(EncodedEvent(s)) if s != self.__empty_string else 'EMPTY' for s in bus_data.read_list)}")
+                                    if trace_enabled:
+                                        Logger.trace(f"Message {msg} forwarded to {key} at index {i}")
+                                        Logger.trace(f"Current read list for {key}:\n{'\n'.join(str(EncodedEvent(s)) if s != self.__empty_string else 'EMPTY' for s in bus_data.read_list)}")
                                     break
                             else:
                                 Logger.warning(f"No empty slot found in {key} to forward message {msg}")
                     self.__move_forward(rec_key)
                 except Exception as e:
                     Logger.error(f"Error processing message {msg} from {rec_key}: {e}")
-                    Logger.debug(traceback.format_exc())
+                    if is_level_enabled(Levels.DEBUG):
+                        Logger.debug(traceback.format_exc())
             time.sleep(0.01)
 
     def stop(self):
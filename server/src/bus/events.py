@@ -5,12 +5,12 @@ from typing import Any, List
 from xml.etree import ElementTree as ET
 import traceback
 
-from gamuLogger import Logger
+from gamuLogger import Levels, Logger
 from version import Version
 
 from ..utils.regex import (RE_DICT_TYPE, RE_LIST_TYPE, RE_TUPLE_TYPE,
                         RE_ENCODED_DICT, RE_ENCODED_LIST, RE_ENCODED_TUPLE)
-from ..utils.misc import split_with_nested
+from ..utils.misc import is_level_enabled, parse_version, split_with_nested
 
 Logger.set_module("Bus.Events")
 
@@ -35,10 +35,16 @@ XML_XMLNS = "{http://forge-server-manager.local/events}"
 
 
 class EncodedEvent:
+    __slots__ = ("__string",) # one instance per message sent or received
+
     def __init__(self, encoded_event: str):
         self.__string = encoded_event
 
     def __str__(self):
+        """
+        Hex dump of the whole message. Building it is linear in the message size,
+        so logs that include an EncodedEvent are guarded with utils.misc.is_level_enabled.
+        """
         return ' '.join(format(ord(c), '02X') for c in self.__string)
 
     def __repr__(self):
@@ -167,14 +173,16 @@ def guess_type(data: Any) -> str:
             guessed_type = f"tuple[{', '.join(item_types)}]"  
         else:  
             guessed_type = "tuple" # empty tuple, cannot guess types
-    Logger.trace(f"Guessed type {original_type} -> {guessed_type}")
+    if is_level_enabled(Levels.TRACE):
+        Logger.trace(f"Guessed type {original_type} -> {guessed_type}")
     return guessed_type
 
 def encode(data : Any, data_type : str) -> str:
     """
     Encodes data into a string based on its type.
     """
-    Logger.trace(f"Encoding data: {data}\nas type: {data_type}")
+    if is_level_enabled(Levels.TRACE): # called for every nested element, formatting the whole data each time adds up
+        Logger.trace(f"Encoding data: {data}\nas type: {data_type}")
     if data_type == "int":
         return str(int(data))
     elif data_type == "float":
@@ -191,7 +199,7 @@ def encode(data : Any, data_type : str) -> str:
         if not isinstance(data, datetime):
             raise TypeError("Expected a datetime instance")
         return str(int(data.timestamp()))
-    elif match_res := RE_LIST_TYPE.match(data_type):
+    elif match_res := RE_LIST_TYPE.fullmatch(data_type):
         if not isinstance(data, list):
             raise TypeError("Expected a list")
         item_type = match_res.group(1)
@@ -199,7 +207,7 @@ def encode(data : Any, data_type : str) -> str:
             encode(item, item_type.strip()) for item in data
         ) + "]"
         return result
-    elif match_res := RE_TUPLE_TYPE.match(data_type):
+    elif match_res := RE_TUPLE_TYPE.fullmatch(data_type):
         if not isinstance(data, tuple):
             raise TypeError("Expected a tuple")
         inner_types = split_with_nested(match_res.group(1))
@@ -209,7 +217,7 @@ def encode(data : Any, data_type : str) -> str:
             encode(item, item_type.strip()) for item, item_type in zip(data, inner_types)
         ) + ")"
         return result
-    elif match_res := RE_DICT_TYPE.match(data_type):
+    elif match_res := RE_DICT_TYPE.fullmatch(data_type):
         if not isinstance(data, dict):
             raise TypeError("Expected a dict")
         inner_types = split_with_nested(match_res.group(1))
@@ -245,7 +253,8 @@ def decode(data: str, data_type: str) -> Any:
         type_prefix, actual_data = data.split(END_OF_MEDIUM, 1)
         return decode(actual_data, type_prefix)
     
-    Logger.trace(f"Decoding data: {data}\nas type: {data_type}")
+    if is_level_enabled(Levels.TRACE):
+        Logger.trace(f"Decoding data: {data}\nas type: {data_type}")
     if data_type == "int":
         return int(data)
     elif data_type == "float":
@@ -253,24 +262,24 @@ def decode(data: str, data_type: str) -> Any:
     elif data_type in ("str", "string"):
         return data
     elif data_type == "Version":
-        return Version.from_string(data)
+        return parse_version(data)
     elif data_type == "bool":
         if data not in ("t", "f"):
             raise ValueError("Expected 't' or 'f' for bool type")
         return data == "t"
     elif data_type == "datetime":
         return datetime.fromtimestamp(int(data))
-    elif match_res := RE_LIST_TYPE.match(data_type):
+    elif match_res := RE_LIST_TYPE.fullmatch(data_type):
         item_type = match_res.group(1)
-        if not (match := RE_ENCODED_LIST.match(data)):
+        if not (match := RE_ENCODED_LIST.fullmatch(data)):
             raise ValueError(f"Expected an encoded list for data: {data}")
         items_str = split_with_nested(match.group(1), NEGATIVE_ACKNOWLEDGE) if match.group(1) else []
         return [
             decode(item_str, item_type.strip()) for item_str in items_str
         ]
-    elif match_res := RE_TUPLE_TYPE.match(data_type):
+    elif match_res := RE_TUPLE_TYPE.fullmatch(data_type):
         inner_types = split_with_nested(match_res.group(1))
-        if not (match := RE_ENCODED_TUPLE.match(data)):
+        if not (match := RE_ENCODED_TUPLE.fullmatch(data)):
             raise ValueError(f"Expected an encoded tuple for data: {data}")
         items_str = split_with_nested(match.group(1), NEGATIVE_ACKNOWLEDGE) if match.group(1) else []
         if len(inner_types) != len(items_str):
@@ -278,13 +287,13 @@ def decode(data: str, data_type: str) -> Any:
         return tuple(
             decode(item_str, item_type.strip()) for item_str, item_type in zip(items_str, inner_types)
         )
-    elif match_res := RE_DICT_TYPE.match(data_type):
+    elif match_res := RE_DICT_TYPE.fullmatch(data_type):
         inner_types = split_with_nested(match_res.group(1))
         if len(inner_types) != 2:
             raise ValueError("Expected a dict with two types (key and value)")
         key_type = inner_types[0].strip()
         value_type = inner_types[1].strip()
-        if not (match := RE_ENCODED_DICT.match(data)):
+        if not (match := RE_ENCODED_DICT.fullmatch(data)):
             raise ValueError(f"Expected an encoded dict for data: {data}")
         items_str = split_with_nested(match.group(1), NEGATIVE_ACKNOWLEDGE) if match.group(1) else []
         result = {}
@@ -8,11 +8,12 @@ from typing import Any, Dict, List
 import shutil
 
 from config import JSONConfig
-from gamuLogger import Logger
+from gamuLogger import Levels, Logger
 from version import Version
 
 from ..bus import Bus, BusDispatcher, Events
-from ..utils.misc import gen_id
+from ..utils.misc import gen_id, is_level_enabled, parse_version
+from ..utils.regex import RE_MC_SERVER_NAME
 from ..minecraft import (McInstallersModules, McServersModules, McInstallersUrls,
                          BaseMcServer, ServerStatus, WebInterface)
 from ..user_interface import UserInterfaceModules
@@ -54,6 +55,10 @@ class Core:
         self.__ui_processes: Dict[str, mp.Process] = {}
         self.__mc_servers  : Dict[str, mp.Process] = {}
 
+        # allowed directories for servers, normalized once as the configuration does not change at runtime
+        self.__mc_dirs = self.__get_mc_dirs()
+        self.__mc_dirs_real = [os.path.realpath(mc_dir) for mc_dir in self.__mc_dirs] # resolved, for path checks
+
         self.__register_event_handlers()
 
         Logger.info("Core initialized successfully.")
@@ -192,7 +197,7 @@ class Core:
             if not isinstance(mc_version_raw, str):
                 Logger.error(f"Invalid Minecraft version for server {server_name}. Cannot start server.")
                 return
-            mc_version = Version.from_string(mc_version_raw)
+            mc_version = parse_version(mc_version_raw)
             
             def __start_mc_server():
                 try:
@@ -284,23 +289,33 @@ class Core:
         :param server_path: Path to the server directory
         :return: True if the path is valid, False otherwise
         """
-        server_path = os.path.normpath(server_path)
-        if not server_path:
-            Logger.error("Server path cannot be empty.")
-            return False
         if not isinstance(server_path, str):
             Logger.error("Server path must be a string.")
             return False
+        if not server_path:
+            Logger.error("Server path cannot be empty.")
+            return False
 
-        allowed_dirs = self.__get_mc_dirs()
+        # resolve symlinks and ".." so the path can't escape the allowed directories
+        real_path = os.path.realpath(server_path)
 
-        # for mc_dir in self.__config.get("minecraft_servers_dirs"): # must be in one of these directories
-        if not any(server_path.startswith(mc_dir) for mc_dir in allowed_dirs):
-            Logger.error(f"Server path {server_path} is not in the allowed directories: {allowed_dirs}")
+        # must be in one of the allowed directories
+        if not any(self.__is_path_in_dir(real_path, mc_dir) for mc_dir in self.__mc_dirs_real):
+            Logger.error(f"Server path {server_path} is not in the allowed directories: {self.__mc_dirs}")
             return False
 
         return True
 
+    @staticmethod
+    def __is_path_in_dir(path: str, directory: str) -> bool:
+        """
+        Checks if a resolved path is the given resolved directory or inside it.
+        """
+        try:
+            return os.path.commonpath([path, directory]) == directory
+        except ValueError: # paths on different drives
+            return False
+
     def __get_server_status(self, server_name: str) -> ServerStatus:
         """
         Checks if the server is running.
@@ -375,14 +390,11 @@ class Core:
         modloader_version: Version,
         ram: int,
     ) -> None:
-        mc_versions : List[Version] = WebInterface.get_mc_versions()
-        server_id = gen_id()
-        
-        # data validation
-        if mc_version not in mc_versions:
-            Logger.error(f"Invalid Minecraft version: {mc_version}. Available versions: {mc_versions}")
+        # data validation, local checks first so invalid requests never reach the network
+        if not RE_MC_SERVER_NAME.fullmatch(server_name):
+            Logger.error(f"Invalid server name: {server_name}. Only letters, digits and underscores are allowed (up to 16 characters).")
             return
-        if server_type not in McInstallersModules:
+        if not isinstance(server_type, str) or server_type not in McInstallersModules:
             Logger.error(f"Unknown server type: {server_type}. Available types: {list(McInstallersModules.keys())}")
             return
         if server_name in self._srv_config:
@@ -394,8 +406,12 @@ class Core:
         if not isinstance(ram, int) or ram <= 0:
             Logger.error(f"Invalid RAM value: {ram}. Must be a positive integer.")
             return
+        mc_versions : List[Version] = WebInterface.get_mc_versions()
+        if mc_version not in mc_versions:
+            Logger.error(f"Invalid Minecraft version: {mc_version}. Available versions: {mc_versions}")
+            return
 
-
+        server_id = gen_id()
         server_path = os.path.join(server_path, server_id)
         if os.path.exists(server_path):
             Logger.error(f"Server path {server_path} already exists.")
@@ -489,6 +505,9 @@ class Core:
         :param new_name: The new name for the server.
         :return: True if the server was renamed successfully, False otherwise.
         """
+        if not RE_MC_SERVER_NAME.fullmatch(new_name):
+            Logger.error(f"Invalid server name: {new_name}. Only letters, digits and underscores are allowed (up to 16 characters).")
+            return
         if server_name not in self._srv_config:
             Logger.error(f"Server {server_name} not found.")
             return
@@ -540,8 +559,8 @@ class Core:
             "type": srv_info['type'],
             "path": srv_info['path'],
             "autostart": srv_info['autostart'],
-            "mc_version": Version.from_string(srv_info['mc_version']),
-            "modloader_version": Version.from_string(srv_info['modloader_version']),
+            "mc_version": parse_version(srv_info['mc_version']),
+            "modloader_version": parse_version(srv_info['modloader_version']),
             "ram": srv_info['ram'],
             "started_at": self.__bus.trigger(
                 Events['SERVER.STARTED_AT'],
@@ -558,7 +577,8 @@ class Core:
             return WebInterface.get_mc_versions()
         except Exception as e:
             Logger.error(f"Failed to fetch Minecraft versions: {e}")
-            Logger.debug(traceback.format_exc())
+            if is_level_enabled(Levels.DEBUG):
+                Logger.debug(traceback.format_exc())
             return []
 
     def on_get_version_forge(self, timestamp: datetime, mc_version: Version) -> dict[Version, dict[str, Any]]:
@@ -571,7 +591,8 @@ class Core:
             return WebInterface.get_forge_versions(mc_version)
         except Exception as e:
             Logger.error(f"Failed to fetch Forge versions for Minecraft version {mc_version}: {e}")
-            Logger.debug(traceback.format_exc())
+            if is_level_enabled(Levels.DEBUG):
+                Logger.debug(traceback.format_exc())
             return {}
 
     def on_get_minecraft_directories(self, timestamp: datetime) -> list[str]:
@@ -579,4 +600,4 @@ class Core:
         Returns a list of all available Minecraft server directories.
         This is useful for the user interface to provide a selection of directories.
         """
-        return self.__get_mc_dirs()
+        return list(self.__mc_dirs)
@@ -10,7 +10,7 @@ from .utils.debug_tk import DebugTk, ask_for_choice
 
 Logger.set_module("Forge Server.Debug Interface")
 
-BASE_PATH = __file__[:__file__.rfind('/')]  # get the base path of the server
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))  # get the base path of the server
 
 
 def parse_args():
@@ -31,14 +31,15 @@ def load_event_descriptions() -> dict[str, dict[str, str|dict[str, str]]]:
 
 
 def generate_event_md(event : Event, event_desc : str, args_descs : dict[str, str], return_desc : str) -> str:
-    arguments_md = ""
-    for arg in event.args:
-        arguments_md += arg_row_md_template.format(
+    arguments_md = "".join(
+        arg_row_md_template.format(
             name=arg.name,
             type=arg.type,
             id=arg.id,
             description=args_descs.get(f"{arg.id:03d}", "No description available.")
         ) + "\n"
+        for arg in event.args
+    )
     return event_md_template.format(
         name=event.name,
         id=event.id,
@@ -64,7 +64,11 @@ class MinecraftServer(BaseMcServer):
         """
         Start the Minecraft Forge server./
         """
-        Logger.set_module(f"Mc Server.{self.name}")
+        try:
+            # scoped to this function, gamuLogger limits each module name part to 15 characters
+            Logger.set_module(f"Mc Server.{self.name[:15]}")
+        except ValueError as e: # name already used by another module (e.g. "Properties")
+            Logger.debug(f"Cannot use server name as logger module, keeping the default one: {e}")
 
         process = self._spawn_server_process()
 
@@ -11,7 +11,7 @@ from version import Version
 
 Logger.set_module("Mc Server.Web Interface")
 
-RE_MC_VERSION = re.compile(r"^([0-9]+)\.([0-9]+)\.([0-9]+)$")
+RE_MC_VERSION = re.compile(r"([0-9]+)\.([0-9]+)\.([0-9]+)", re.ASCII) # use with fullmatch
 RE_FORGE_VERSION = re.compile(r"([0-9]+)\.([0-9]+)\.([0-9]+)(?:\.([0-9]+))?")
 
 class WebInterface:
@@ -60,11 +60,12 @@ class WebInterface:
                     version_text = child
                     if version_text:
                         break
+            version_text = version_text.strip() # raw text node, may carry surrounding whitespace or newlines
             if version_text == "No versions found":
                 continue
             if version_text.count('.') == 1:
-                version_text = f"{version_text.strip()}.0"
-            if not (version_match := RE_MC_VERSION.match(version_text)):
+                version_text = f"{version_text}.0"
+            if not (version_match := RE_MC_VERSION.fullmatch(version_text)):
                 raise ValueError(f"Invalid Minecraft version format: {version_text}")
 
             version = Version.from_string(version_match.group(0))
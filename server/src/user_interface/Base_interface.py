@@ -1,3 +1,6 @@
+import threading
+import time
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
 from typing import Any, Dict
 from traceback import format_exc
@@ -7,8 +10,9 @@ from gamuLogger import Logger
 from version import Version
 
 from ..bus import Bus, BusData, Callback, Event, Events
-from ..utils.hash import hash_string, verify_hash
+from ..utils.hash import hash_string, needs_rehash, verify_hash
 from ..utils.misc import time_from_now
+from ..utils.regex import RE_MC_SERVER_NAME
 from .database import AccessLevel, AccessToken, Database, User
 
 Logger.set_module("User Interface.Base")
@@ -40,14 +44,30 @@ class BaseInterface:
         "on_player_pardoned": Events["PLAYERS.PARDONED"]
     }
 
+    TOKEN_CACHE_TTL = 60 # seconds a validated token is trusted without hitting the database
+    TOKEN_CACHE_SIZE = 1024 # maximum number of cached tokens, least recently used are evicted first
+    LOGIN_MAX_FAILURES = 5 # failed logins allowed per (user, client) within LOGIN_FAILURES_WINDOW
+    LOGIN_FAILURES_WINDOW = 60 # seconds
+    LOGIN_THROTTLE_DELAY = 1 # seconds a login is delayed instead of refused when the client is unknown
+    VERSIONS_CACHE_TTL = 3600 # seconds the available Minecraft/Forge versions are kept before asking the core again
+
     def __init__(self, bus_data : BusData, database_path: str):
         if hasattr(self, "_BaseInterface__bus"): # Avoid reinitializing the bus
             return
         self.__bus = Bus(bus_data)
 
         self._database = Database(database_path)
+        self.__token_cache : OrderedDict[str, tuple[AccessToken, User, float]] = OrderedDict()
+        self.__token_cache_lock = threading.Lock()
+        self.__token_cache_generation = 0 # bumped on every invalidation, see __get_token_and_user
+        self.__login_failures : dict[tuple[str, str|None], deque[float]] = {}
+        self.__login_failures_lock = threading.Lock()
+        self.__versions_cache : dict[Version|None, tuple[Any, float]] = {}
+        self.__versions_cache_lock = threading.Lock()
 
         self.__register_methods()
+        # every user interface runs in its own process with its own token cache, keep them in sync
+        self.__bus.register(Events["USERS.TOKENS_INVALIDATED"], self.__on_tokens_invalidated)
 
     def __register_methods(self):
         for method_name, event in self.callback_map.items():
@@ -92,11 +112,109 @@ class BaseInterface:
 
 ####################################### User database methods #####################################
 
-    def login(self, username: str, password: str, remember : bool = False) -> AccessToken:
+    def __get_token_and_user(self, token: str) -> tuple[AccessToken, User]:
+        """
+        Get the access token and its user, raising if the token is unknown or expired.
+        """
+        with self.__token_cache_lock:
+            if (cached := self.__token_cache.get(token)) is not None:
+                access_token, user, deadline = cached
+                if time.monotonic() < deadline and access_token.is_valid():
+                    self.__token_cache.move_to_end(token)
+                    return access_token, user
+                del self.__token_cache[token]
+            generation = self.__token_cache_generation
+
+        res = self._database.get_token_and_user(token)
+        if res is None or not res[0].is_valid():
+            raise ValueError("Invalid or expired token.")
+
+        with self.__token_cache_lock:
+            if generation != self.__token_cache_generation:
+                # a token was invalidated while querying, the result may be the revoked row: don't cache it
+                return res
+            self.__token_cache[token] = (*res, time.monotonic() + self.TOKEN_CACHE_TTL)
+            self.__token_cache.move_to_end(token)
+            while len(self.__token_cache) > self.TOKEN_CACHE_SIZE:
+                self.__token_cache.popitem(last=False)
+        return res
+
+    def __invalidate_token(self, token: str, broadcast : bool = True):
+        """
+        Remove a token from the token cache.
+        :param broadcast: Also ask the other user interfaces to remove it from their cache.
+        """
+        with self.__token_cache_lock:
+            self.__token_cache_generation += 1
+            self.__token_cache.pop(token, None)
+        if broadcast:
+            self.__broadcast_tokens_invalidated(token=token)
+
+    def __invalidate_user_tokens(self, username: str, broadcast : bool = True):
+        """
+        Remove all cached tokens belonging to the given user.
+        :param broadcast: Also ask the other user interfaces to remove them from their cache.
+        """
+        with self.__token_cache_lock:
+            self.__token_cache_generation += 1
+            for token in [t for t, (access_token, _, _) in self.__token_cache.items() if access_token.username == username]:
+                del self.__token_cache[token]
+        if broadcast:
+            self.__broadcast_tokens_invalidated(username=username)
+
+    def __broadcast_tokens_invalidated(self, token: str = "", username: str = ""):
+        try:
+            self.__bus.trigger(Events["USERS.TOKENS_INVALIDATED"], token=token, username=username)
+        except ValueError as e: # the database is already up to date, other caches expire after TOKEN_CACHE_TTL anyway
+            Logger.error(f"Failed to notify the other interfaces of the token invalidation: {e}")
+
+    def __on_tokens_invalidated(self, timestamp: datetime, token: str, username: str):
+        """
+        Called when another user interface invalidated a token (token set) or all the tokens of a user (username set).
+        """
+        if token:
+            self.__invalidate_token(token, broadcast=False)
+        if username:
+            self.__invalidate_user_tokens(username, broadcast=False)
+
+    def __check_login_rate(self, username: str, client: str|None):
+        """
+        Check the recent failed logins of this user from this client, before any password hashing is done.
+        Raise if there were too many; when the client is unknown, only slow the attempt down,
+        so that anyone knowing a username cannot lock its owner out.
+        """
+        key = (username, client)
+        now = time.monotonic()
+        with self.__login_failures_lock:
+            if (failures := self.__login_failures.get(key)) is None:
+                return
+            while failures and failures[0] <= now - self.LOGIN_FAILURES_WINDOW:
+                failures.popleft()
+            if not failures:
+                del self.__login_failures[key]
+                return
+            if len(failures) < self.LOGIN_MAX_FAILURES:
+                return
+        if client is not None:
+            Logger.debug(f"Too many failed login attempts for user {username} from {client}")
+            raise ValueError("Too many failed login attempts, try again later.")
+        Logger.debug(f"Too many failed login attempts for user {username}, throttling")
+        time.sleep(self.LOGIN_THROTTLE_DELAY)
+
+    def __record_login_failure(self, username: str, client: str|None):
+        now = time.monotonic()
+        with self.__login_failures_lock:
+            # a key is otherwise only pruned when checked again, drop the ones whose last failure is out of the window
+            for key in [k for k, failures in self.__login_failures.items() if not failures or failures[-1] <= now - self.LOGIN_FAILURES_WINDOW]:
+                del self.__login_failures[key]
+            self.__login_failures.setdefault((username, client), deque(maxlen=self.LOGIN_MAX_FAILURES)).append(now)
+
+    def login(self, username: str, password: str, remember : bool = False, client : str|None = None) -> AccessToken:
         """
         Login a user with the given username and password.
         If remember is True, the user will be remembered for future logins.
         Returns True if login is successful, False otherwise.
+        :param client: Identifier of the caller (e.g. its IP address), failed logins are limited per user and client.
         """
 
         if not username or not password:
@@ -105,25 +223,35 @@ class BaseInterface:
             )
             raise ValueError("Missing parameters for login. Username and password are required.")
 
-        if not self._database.has_user(username):
+        self.__check_login_rate(username, client)
+        if (user := self._database.get_user_or_none(username)) is None:
             raise ValueError(f"User {username} does not exist.")
-        user = self._database.get_user(username)
         try:
             if not verify_hash(password, user.password):
                 Logger.trace(f"User {username} provided invalid password")
+                self.__record_login_failure(username, client)
                 raise ValueError("Invalid password.")
         except argon2.exceptions.VerifyMismatchError as e:
             Logger.trace(f"Password verification failed for user {username}: {e}")
 
+        with self.__login_failures_lock:
+            self.__login_failures.pop((username, client), None)
+
+        password_hash = user.password
+        if needs_rehash(password_hash):
+            # the password is known to be valid here, upgrade the stored hash to the current parameters
+            password_hash = hash_string(password)
+            Logger.debug(f"Password hash for user {username} upgraded")
+
         token = AccessToken.new(username, time_from_now(timedelta(hours=1)), remember)
-        self._database.set_user_token(token)
-        self._database.update_user(User(
+        self._database.login_commit(User(
             username=user.username,
-            password=user.password,
+            password=password_hash,
             access_level=user.access_level,
             registered_at=user.registered_at,
             last_login=datetime.now()
-        ))
+        ), token)
+        self.__invalidate_user_tokens(username) # the previous token of this user has been replaced
         Logger.trace(f"User {username} logged in with token {token.token}")
         return token
 
@@ -138,21 +266,20 @@ class BaseInterface:
             )
             raise ValueError("Missing parameters for registration. Username and password are required.")
 
-        password = hash_string(password)
-
         if self._database.has_user(username):
             Logger.debug(f"User {username} already exists")
             raise ValueError(f"User {username} already exists.")
 
-        self._database.add_user(User(
+        password = hash_string(password)
+
+        token = AccessToken.new(username, time_from_now(timedelta(hours=1)), remember)
+        self._database.register_commit(User(
             username=username,
             password=password,
             access_level=AccessLevel.USER,
             registered_at=datetime.now(),
             last_login=datetime.now()
-        ))
-        token = AccessToken.new(username, time_from_now(timedelta(hours=1)), remember)
-        self._database.set_user_token(token)
+        ), token)
         Logger.debug(f"User {username} registered with token {token.token}")
         return token
 
@@ -167,19 +294,14 @@ class BaseInterface:
             raise ValueError(f"Token {token} does not exist.")
 
         self._database.delete_user_token(token)
+        self.__invalidate_token(token)
         Logger.debug(f"User logged out with token {token}.")
 
     def delete_user(self, token : str):
-        access_token = self._database.get_user_token_by_token(token)
-        if not access_token or not access_token.is_valid():
-            raise ValueError("Invalid or expired token.")
-
-        user = self._database.get_user(access_token.username)
-        if not user:
-            raise ValueError(f"User {access_token.username} does not exist.")
+        _, user = self.__get_token_and_user(token)
 
-        self._database.delete_user(user.username)
-        self._database.delete_user_token(token)
+        self._database.delete_user(user.username) # also deletes the user's access tokens
+        self.__invalidate_user_tokens(user.username)
         Logger.debug(f"User {user.username} deleted successfully.")
 
     def get_user_info(self, token: str) -> User:
@@ -189,29 +311,20 @@ class BaseInterface:
         if not token:
             raise ValueError("Missing token for get_user_info.")
 
-        access_token = self._database.get_user_token_by_token(token)
-        if not access_token or not access_token.is_valid():
-            raise ValueError("Invalid or expired token.")
-
-        if user := self._database.get_user(access_token.username):
-            return user
-        else:
-            raise ValueError(f"User {access_token.username} does not exist.")
+        _, user = self.__get_token_and_user(token)
+        return user
 
     def update_password(self, token: str, password: str):
         """
         Update the password for the user associated with the given token.
         """
-        access_token = self._database.get_user_token_by_token(token)
-        if not access_token or not access_token.is_valid():
-            raise ValueError("Invalid or expired token.")
-
-        user = self._database.get_user(access_token.username)
+        _, user = self.__get_token_and_user(token)
 
         if not password:
             raise ValueError("Missing password for update.")
-        user.password = hash_string(password)
-        self._database.update_user(user)
+        # the user may come from the token cache, only write the password so other columns are not reverted
+        self._database.update_user_password(user.username, hash_string(password))
+        self.__invalidate_user_tokens(user.username)
         Logger.debug(f"Password for user {user.username} updated successfully.")
 
     def get_user_info_by_username(self, username: str) -> User:
@@ -221,7 +334,7 @@ class BaseInterface:
         if not username:
             raise ValueError("Missing username for get_user_info_by_username.")
 
-        if user := self._database.get_user(username):
+        if user := self._database.get_user_or_none(username):
             return user
         else:
             raise ValueError(f"User {username} does not exist.")
@@ -229,11 +342,12 @@ class BaseInterface:
     def update_user_access(self, username: str, access_level: str):
         if not access_level:
             raise ValueError("Missing access level for update_user_access.")
-        user = self._database.get_user(username)
+        user = self._database.get_user_or_none(username)
         if not user:
             raise ValueError(f"User {username} does not exist.")
         user.access_level = AccessLevel[access_level]
         self._database.update_user(user)
+        self.__invalidate_user_tokens(username)
 
     def update_user_password(self, username: str, password: str):
         """
@@ -241,26 +355,41 @@ class BaseInterface:
         """
         if not password:
             raise ValueError("Missing password for update_user_password.")
-        user = self._database.get_user(username)
-        if not user:
+        if not self._database.has_user(username):
             raise ValueError(f"User {username} does not exist.")
-        user.password = hash_string(password)
-        self._database.update_user(user)
+        self._database.update_user_password(username, hash_string(password))
+        self.__invalidate_user_tokens(username)
 
  #################################### Minecraft server methods ####################################
 
+    def __get_versions(self, key: Version|None, event_name: str, **kwargs) -> Any:
+        """
+        Trigger a version listing event, reusing the last result for VERSIONS_CACHE_TTL seconds.
+        :param key: The cache key (None for the Minecraft versions, the Minecraft version for Forge ones).
+        """
+        now = time.monotonic()
+        with self.__versions_cache_lock:
+            if (cached := self.__versions_cache.get(key)) is not None and now < cached[1]:
+                return cached[0]
+
+        versions = self.trigger(event_name, **kwargs)
+        if versions: # empty results are returned by the core when fetching failed, don't keep them
+            with self.__versions_cache_lock:
+                self.__versions_cache[key] = (versions, now + self.VERSIONS_CACHE_TTL)
+        return versions
+
     def list_mc_versions(self) -> list[Version]:
         """
         List all available Minecraft server versions.
         """
-        versions : list[Version] = self.trigger("GET_VERSIONS.MINECRAFT")
+        versions : list[Version] = self.__get_versions(None, "GET_VERSIONS.MINECRAFT")
         return versions
 
     def list_forge_versions(self, mc_version: Version) -> list[Version]:
         """
         List all available Forge versions for the given Minecraft version.
         """
-        versions = self.trigger("GET_VERSIONS.FORGE", mc_version=mc_version)
+        versions = self.__get_versions(mc_version, "GET_VERSIONS.FORGE", mc_version=mc_version)
         return versions
 
     def list_servers(self) -> list[Dict[str, Any]]:
@@ -289,28 +418,30 @@ class BaseInterface:
         ram: int = 1024,
     ) -> None:
         """
-        Create a new Minecraft server with the given parameters.
-        Returns the created server information.
+        Request the creation of a new Minecraft server with the given parameters.
+        The creation runs asynchronously in the core, `on_server_created` is called once it is done.
         """
         if not name or not type or not path or not mc_version:
             raise ValueError("Missing parameters for create_server. Name, type, path, and Minecraft version are required.")
+        if not RE_MC_SERVER_NAME.fullmatch(name):
+            # checked here too so invalid names are rejected without a round-trip to the core
+            raise ValueError("Invalid server name. Only letters, digits and underscores are allowed (max 16 characters).")
 
         if type != "vanilla" and modloader_version is None:
             raise ValueError("Missing modloader version for non-vanilla server types.")
         if not isinstance(ram, int) or ram <= 0:
             raise ValueError("RAM must be a positive integer.")
 
-        if self.trigger("SERVER.CREATE",
-                        server_name=name,
-                        server_type=type,
-                        server_path=path,
-                        autostart=autostart,
-                        mc_version=mc_version,
-                        modloader_version=modloader_version or Version(0,0,0),
-                        ram=ram):
-            Logger.debug(f"Server {name} created successfully.")
-        else:
-            raise ValueError(f"Failed to create server {name}. It may already exist or there was an error in the parameters.")
+        # SERVER.CREATE has no return value: the core validates the request and installs the server in the background
+        self.trigger("SERVER.CREATE",
+                     server_name=name,
+                     server_type=type,
+                     server_path=path,
+                     autostart=autostart,
+                     mc_version=mc_version,
+                     modloader_version=modloader_version or Version(0,0,0),
+                     ram=ram)
+        Logger.debug(f"Creation of server {name} requested.")
 
     def list_mc_server_dirs(self) -> list[str]:
         """
@@ -1,5 +1,7 @@
 import os
 import sqlite3
+import sys
+import threading
 from datetime import datetime
 from typing import Dict
 
@@ -9,6 +11,18 @@ from .types import AccessLevel, AccessToken, User
 
 Logger.set_module("User Interface.Database")
 
+def _os_thread_local() -> threading.local:
+    """
+    Storage local to the OS thread.
+    Under eventlet (same detection as utils.hash._run_blocking), threading.local is patched to be local
+    to each green thread, which would open a connection per client; all green threads of an OS thread
+    can share one connection instead.
+    """
+    if "eventlet" in sys.modules:
+        from eventlet import patcher  # type: ignore
+        return patcher.original("threading").local()
+    return threading.local()
+
 class Database:
     __instances : Dict[str, 'Database'] = {}
 
@@ -23,24 +37,51 @@ class Database:
         return cls.__instances[db_file]
 
     def __init__(self, db_file : str):
+        if hasattr(self, "_Database__local"):
+            return # singleton already initialized, keep the existing connections
         Logger.debug(f"Connecting to database {db_file}")
         os.makedirs(os.path.dirname(db_file), exist_ok=True)
-        try:
-            self.connection = sqlite3.connect(db_file)
-        except sqlite3.Error as e:
-            Logger.error(f"Error connecting to database: {e}")
-            Logger.debug(f"Database file: {db_file}")
-            raise e
-        self.cursor = self.connection.cursor()
+        self.__db_file = db_file
+        self.__local = _os_thread_local() # one connection per OS thread, opened lazily and reused
         self.create_table()
         Logger.info(f"Database connected to {db_file}")
 
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        The connection to the database for the current OS thread.
+        It is opened on first use and reused by all subsequent calls from the same thread.
+        """
+        connection = getattr(self.__local, "connection", None)
+        if connection is None:
+            try:
+                connection = sqlite3.connect(self.__db_file)
+            except sqlite3.Error as e:
+                Logger.error(f"Error connecting to database: {e}")
+                Logger.debug(f"Database file: {self.__db_file}")
+                raise e
+            self.__local.connection = connection
+            self.__local.cursor = connection.cursor()
+        return connection
+
+    @property
+    def cursor(self) -> sqlite3.Cursor:
+        """
+        The cursor of the current thread's connection.
+        """
+        if getattr(self.__local, "cursor", None) is None:
+            _ = self.connection
+        return self.__local.cursor
+
     def close(self):
         """
-        Close the database connection.
+        Close the database connection of the current thread.
         """
-        if self.connection:
-            self.connection.close()
+        local = getattr(self, "_Database__local", None)
+        if local is not None and (connection := getattr(local, "connection", None)) is not None:
+            connection.close()
+            local.connection = None
+            local.cursor = None
 
     def __del__(self):
         """
@@ -78,6 +119,13 @@ class Database:
         """
         Add a new user to the database.
         """
+        self.__insert_user(user)
+        self.connection.commit()
+
+        # set default access level for all servers
+        Logger.debug(f"User {user.username} added with access level {user.access_level.name}")
+
+    def __insert_user(self, user : User):
         self.cursor.execute('''
             INSERT INTO users (username, password, access_level, registered_at, last_login)
             VALUES (?, ?, ?, ?, ?)
@@ -90,10 +138,6 @@ class Database:
                 int(datetime.now().timestamp())
             )
         )
-        self.connection.commit()
-
-        # set default access level for all servers
-        Logger.debug(f"User {user.username} added with access level {user.access_level.name}")
 
     def get_user(self, username : str) -> User:
         """
@@ -101,13 +145,23 @@ class Database:
         :param username: The username of the user.
         :return: The user object.
         """
+        if (user := self.get_user_or_none(username)) is None:
+            raise ValueError(f"User {username} not found")
+        return user
+
+    def get_user_or_none(self, username : str) -> User | None:
+        """
+        Get a user from the database, without raising if it does not exist.
+        :param username: The username of the user.
+        :return: The user object, or None if the user does not exist.
+        """
         self.cursor.execute('''
             SELECT username, password, access_level, registered_at, last_login
             FROM users WHERE username = ?
         ''', (username,))
         res = self.cursor.fetchone()
         if res is None:
-            raise ValueError(f"User {username} not found")
+            return None
         Logger.trace(res)
         return User(
             username=res[0],
@@ -133,31 +187,44 @@ class Database:
         Update a user (defined by it's username) in the database.
         :param user: The user object.
         """
+        self.__update_user(user)
+        self.connection.commit()
+        Logger.debug(f"User {user} updated")
+
+    def __update_user(self, user : User):
         self.cursor.execute('''
             UPDATE users SET password = ?, access_level = ?, last_login = ?
             WHERE username = ?
         ''', (user.password, user.access_level.value, int(user.last_login.timestamp()), user.username))
+
+    def update_user_password(self, username : str, password : str):
+        """
+        Update only the password of a user, leaving its other columns untouched.
+        :param username: The username of the user.
+        :param password: The new password hash.
+        """
+        self.cursor.execute('''
+            UPDATE users SET password = ? WHERE username = ?
+        ''', (password, username))
         self.connection.commit()
-        Logger.debug(f"User {user} updated")
+        Logger.debug(f"Password of user {username} updated")
 
     def delete_user(self, username : str):
         """
-        Delete a user from the database.
+        Delete a user from the database, along with all of its access tokens.
         :param username: The username of the user.
         """
         # delete user from users table
         self.cursor.execute('''
             DELETE FROM users WHERE username = ?
         ''', (username,))
-        self.connection.commit()
-        Logger.debug(f"User {username} deleted")
 
-        # delete all access tokens for this user
+        # delete all access tokens for this user, in the same transaction
         self.cursor.execute('''
             DELETE FROM access_tokens WHERE username = ?
         ''', (username,))
         self.connection.commit()
-        Logger.debug(f"Access tokens for user {username} deleted")
+        Logger.debug(f"User {username} and its access tokens deleted")
 
     def get_users(self) -> list[User]:
         """
@@ -186,13 +253,38 @@ class Database:
         :param token: The access token.
         :param expiration: The expiration time of the token.
         """
+        self.__insert_user_token(access_token)
+        self.connection.commit()
+        Logger.debug(f"Access token for user {access_token.username} set to \"{access_token.token}\"\nwith expiration {access_token.expiration.strftime('%Y-%m-%d %H:%M:%S')} {'(remembered)' if access_token.remember else ''}")
+        return self
+
+    def __insert_user_token(self, access_token : AccessToken):
         self.cursor.execute('''
             INSERT OR REPLACE INTO access_tokens (username, token, expiration, remember)
             VALUES (?, ?, ?, ?)
         ''', (access_token.username, access_token.token, int(access_token.expiration.timestamp()), "TRUE" if access_token.remember else "FALSE"))
-        self.connection.commit()
-        Logger.debug(f"Access token for user {access_token.username} set to \"{access_token.token}\"\nwith expiration {access_token.expiration.strftime('%Y-%m-%d %H:%M:%S')} {'(remembered)' if access_token.remember else ''}")
-        return self
+
+    def login_commit(self, user : User, access_token : AccessToken):
+        """
+        Update a user and store its new access token, in a single transaction.
+        :param user: The updated user object.
+        :param access_token: The new access token.
+        """
+        with self.connection: # commits on success, rolls back on error
+            self.__insert_user_token(access_token)
+            self.__update_user(user)
+        Logger.debug(f"User {user.username} logged in, access token and user updated")
+
+    def register_commit(self, user : User, access_token : AccessToken):
+        """
+        Add a new user and its first access token, in a single transaction.
+        :param user: The new user object.
+        :param access_token: The access token of the user.
+        """
+        with self.connection: # commits on success, rolls back on error
+            self.__insert_user(user)
+            self.__insert_user_token(access_token)
+        Logger.debug(f"User {user.username} added with access level {user.access_level.name}")
 
     def get_user_token(self, username : str) -> AccessToken:
         """
@@ -246,6 +338,37 @@ class Database:
             raise ValueError(f"Access token {token} not found")
         return self.get_user(res[0])
 
+    def get_token_and_user(self, token : str) -> tuple[AccessToken, User] | None:
+        """
+        Get an access token and the user it belongs to, using a single query.
+        :param token: The access token.
+        :return: A tuple (access token, user), or None if the token does not exist.
+        """
+        self.cursor.execute('''
+            SELECT t.username, t.token, t.expiration, t.remember,
+                   u.password, u.access_level, u.registered_at, u.last_login
+            FROM access_tokens t JOIN users u ON t.username = u.username
+            WHERE t.token = ?
+            LIMIT 1
+        ''', (token,))
+        res = self.cursor.fetchone()
+        if res is None:
+            return None
+        access_token = AccessToken(
+            username=res[0],
+            token=res[1],
+            expiration=datetime.fromtimestamp(res[2]),
+            remember=res[3] == "TRUE"
+        )
+        user = User(
+            username=res[0],
+            password=res[4],
+            access_level=AccessLevel(res[5]),
+            registered_at=datetime.fromtimestamp(res[6]),
+            last_login=datetime.fromtimestamp(res[7])
+        )
+        return access_token, user
+
     def exist_user_token(self, token : str) -> bool:
         """
         Check if an access token exists in the database.
@@ -9,6 +9,13 @@ class AccessLevel(IntEnum):
     OPERATOR = 2    # Global: Can manage users and create and delete servers
 
 
+def _fmt_dt(dt: datetime) -> str:
+    """
+    Format a datetime as "dd/mm/YYYY, HH:MM:SS", without going through strftime's format parser.
+    """
+    return f"{dt.day:02d}/{dt.month:02d}/{dt.year}, {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
 class User:
     def __init__(self, username: str, password: str, registered_at : datetime, last_login : datetime, access_level: AccessLevel = AccessLevel.USER):
         self.username = username
@@ -17,8 +24,46 @@ class User:
         self.last_login = last_login
         self.access_level = access_level
 
+    @property
+    def registered_at(self) -> datetime:
+        return self.__registered_at
+
+    @registered_at.setter
+    def registered_at(self, value: datetime):
+        self.__registered_at = value
+        self.__registered_at_str : str|None = None
+
+    @property
+    def registered_at_str(self) -> str:
+        """
+        Get the registration date formatted as "dd/mm/YYYY, HH:MM:SS".
+        The string is computed once and reused until registered_at is changed.
+        """
+        if self.__registered_at_str is None:
+            self.__registered_at_str = _fmt_dt(self.__registered_at)
+        return self.__registered_at_str
+
+    @property
+    def last_login(self) -> datetime:
+        return self.__last_login
+
+    @last_login.setter
+    def last_login(self, value: datetime):
+        self.__last_login = value
+        self.__last_login_str : str|None = None
+
+    @property
+    def last_login_str(self) -> str:
+        """
+        Get the last login date formatted as "dd/mm/YYYY, HH:MM:SS".
+        The string is computed once and reused until last_login is changed.
+        """
+        if self.__last_login_str is None:
+            self.__last_login_str = _fmt_dt(self.__last_login)
+        return self.__last_login_str
+
     def __repr__(self):
-        return f"User(username={self.username}, access_level={self.access_level}, registered_at={self.registered_at.strftime("%d/%m/%Y, %H:%M:%S")}, last_login={self.last_login.strftime("%d/%m/%Y, %H:%M:%S")})"
+        return f"User(username={self.username}, access_level={self.access_level}, registered_at={self.registered_at_str}, last_login={self.last_login_str})"
 
     @classmethod
     def new(cls, username: str, password: str, access_level: AccessLevel = AccessLevel.USER):
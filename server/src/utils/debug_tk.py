@@ -1,4 +1,5 @@
 import tkinter as tk
+from collections import deque
 from typing import Callable, Tuple
 
 from gamuLogger import Logger
@@ -7,8 +8,14 @@ Logger.set_module("User Interface.Debug Tkinter")
 
 
 class DebugTk(tk.Tk):
+    TERMINAL_FLUSH_INTERVAL = 16 # ms between two terminal refreshes (~60 fps) while messages arrive
+    TERMINAL_IDLE_INTERVAL = 500 # ms, the refresh interval doubles up to this value while nothing is written
+    TERMINAL_MAX_LINES = 5000 # older lines are removed from the terminal
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.__terminal_flushers : list[Callable[[], bool]] = [] # one per terminal, return True if they wrote something
+        self.__terminal_flush_delay = self.TERMINAL_FLUSH_INTERVAL
         self.title("Debug Tkinter")
         self.geometry("800x600")
         self.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -64,19 +71,54 @@ class DebugTk(tk.Tk):
         input_text.bind("<KeyPress>", on_key_press)
 
 
+        # messages can come from other threads (server output), so they are only queued here
+        # and inserted by the Tk thread, in one batch per refresh
+        pending : deque[str] = deque()
+
         def write_to_terminal(message: str):
+            pending.append(message)
+
+        def flush_terminal() -> bool:
+            if not pending:
+                return False
+            lines = []
+            while pending:
+                lines.append(pending.popleft())
             text.config(state=tk.NORMAL)
-            text.insert(tk.END, message + "\n")
+            text.insert(tk.END, "\n".join(lines) + "\n")
+            line_count = int(text.index("end-1c").split(".")[0])
+            if line_count > self.TERMINAL_MAX_LINES:
+                text.delete("1.0", f"{line_count - self.TERMINAL_MAX_LINES}.0")
             text.see(tk.END)
             text.config(state=tk.DISABLED)
+            return True
+
+        if not self.__terminal_flushers: # a single refresh loop serves all the terminals of the window
+            self.after(self.__terminal_flush_delay, self.__flush_terminals)
+        self.__terminal_flushers.append(flush_terminal)
 
         def clear_terminal():
+            pending.clear()
             text.config(state=tk.NORMAL)
             text.delete("1.0", tk.END)
             text.config(state=tk.DISABLED)
 
         return write_to_terminal, clear_terminal
 
+    def __flush_terminals(self):
+        """
+        Write the pending messages of every terminal, then schedule the next refresh:
+        soon if something was written, otherwise later and later up to TERMINAL_IDLE_INTERVAL.
+        """
+        wrote = False
+        for flush in self.__terminal_flushers:
+            wrote = flush() or wrote
+        if wrote:
+            self.__terminal_flush_delay = self.TERMINAL_FLUSH_INTERVAL
+        else:
+            self.__terminal_flush_delay = min(self.__terminal_flush_delay * 2, self.TERMINAL_IDLE_INTERVAL)
+        self.after(self.__terminal_flush_delay, self.__flush_terminals)
+
     def mainloop(self, n = 0):
         Logger.debug("Starting Debug Tkinter mainloop")
         return super().mainloop(n)
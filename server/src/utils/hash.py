@@ -1,6 +1,37 @@
+import sys
+from typing import Any, Callable
+
 from argon2 import PasswordHasher
 
-ph = PasswordHasher()
+# Argon2id parameters, cheaper than the library defaults (t=3, p=4) so a login only uses one core,
+# while staying within the OWASP recommendations (m=64MiB, t>=2, p=1).
+# Existing hashes made with other parameters are upgraded on the next login (see needs_rehash).
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 64 * 1024 # KiB
+ARGON2_PARALLELISM = 1
+ARGON2_HASH_LEN = 32
+ARGON2_SALT_LEN = 16
+
+ph = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+    hash_len=ARGON2_HASH_LEN,
+    salt_len=ARGON2_SALT_LEN,
+)
+
+def _run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a CPU-bound call (Argon2 hashing).
+    If the calling user interface runs on eventlet with patched threads, the call is sent to eventlet's
+    native thread pool, so the event loop keeps serving other clients meanwhile.
+    eventlet is not a dependency of this package: it is only used if it has already been imported.
+    """
+    if "eventlet" in sys.modules:
+        from eventlet import patcher, tpool  # type: ignore
+        if patcher.is_monkey_patched("thread"):
+            return tpool.execute(func, *args)
+    return func(*args)
 
 def hash_string(input_string: str) -> str:
     """
@@ -9,7 +40,7 @@ def hash_string(input_string: str) -> str:
     :param input_string: The string to hash.
     :return: The Argon2 hash of the input string.
     """
-    return ph.hash(input_string)
+    return _run_blocking(ph.hash, input_string)
 
 def verify_hash(input_string: str, hashed_string: str) -> bool:
     """
@@ -20,7 +51,17 @@ def verify_hash(input_string: str, hashed_string: str) -> bool:
     :return: True if the string matches the hash, False otherwise.
     """
     try:
-        ph.verify(hashed_string, input_string)
+        _run_blocking(ph.verify, hashed_string, input_string)
         return True
     except Exception:
         return False
+
+def needs_rehash(hashed_string: str) -> bool:
+    """
+    Check if a hash was created with outdated Argon2 parameters.
+    Only meant to be called after a successful verification.
+
+    :param hashed_string: The Argon2 hash to check.
+    :return: True if the hash should be recomputed with the current parameters.
+    """
+    return ph.check_needs_rehash(hashed_string)
@@ -1,10 +1,33 @@
 import datetime as dt
-import random
+import re
+import secrets
+from functools import lru_cache
 
-from gamuLogger import Logger
+from gamuLogger import Levels, Logger, Target
+from version import Version
+
+from .regex import RE_TYPING_PREFIX
 
 Logger.set_module("Utils.Misc")
 
+def is_level_enabled(level : Levels) -> bool:
+    """
+    Check if at least one logger target would print a message of the given level.
+    Use it to skip building expensive log messages that would be discarded anyway.
+    """
+    return any(level >= target["level"] for target in Target.list())
+
+
+# Version is immutable and hashable, so a parsed instance can safely be shared;
+# the same few version strings are parsed over and over (version lists, server infos...)
+@lru_cache(maxsize=4096)
+def parse_version(version_str : str) -> Version:
+    """
+    Cached equivalent of Version.from_string, returns the same instance for the same string.
+    """
+    return Version.from_string(version_str)
+
+
 def time_from_now(delta : dt.timedelta) -> dt.datetime:
     """
     return a datetime object from a string corresponding to a time from now
@@ -20,6 +43,8 @@ def _split_top_level_args(s: str) -> list[str]:
     Splits a string like 'str, dict[str, int]' into a list: ['str', 'dict[str, int]'],
     only splitting at the top-level comma.
     """
+    if not any(bracket in s for bracket in "[]()"): # nothing nested, str.split does the same in C
+        return [arg.strip() for arg in s.split(",")]
     args = []
     depth = 0
     last = 0
@@ -41,18 +66,19 @@ def is_types_equals(a: str, b : str) -> bool:
     but list[Version] is different from list[str] or list[int].
     typing.Dict[version.version.Version, typing.Dict[str, typing.Any]] and Dict[Version, Dict[str, Any]] are considered equal.
     """
-    a = a.replace("typing.", "").replace("typing_extensions.", "")
-    b = b.replace("typing.", "").replace("typing_extensions.", "")
-
+    # strip the typing prefixes once, the recursive comparison works on the normalized strings
+    return _is_types_equals(RE_TYPING_PREFIX.sub("", a), RE_TYPING_PREFIX.sub("", b))
 
+@lru_cache(maxsize=4096) # pure function of two strings, called again with the same type names for every event
+def _is_types_equals(a: str, b : str) -> bool:
     if a == b:
         return True
 
     # Handle list and tuple types
     if (a.startswith("list[") or a.startswith("List[")) and (b.startswith("list[") or b.startswith("List[")):
-        return is_types_equals(a[5:-1], b[5:-1])
+        return _is_types_equals(a[5:-1], b[5:-1])
     if (a.startswith("tuple[") or a.startswith("Tuple[")) and (b.startswith("tuple[") or b.startswith("Tuple[")):
-        return is_types_equals(a[6:-1], b[6:-1])
+        return _is_types_equals(a[6:-1], b[6:-1])
 
     # Handle dict types
     if (a.startswith("dict[") or a.startswith("Dict[")) and (b.startswith("dict[") or b.startswith("Dict[")):
@@ -60,7 +86,7 @@ def is_types_equals(a: str, b : str) -> bool:
         args_b = _split_top_level_args(b[5:-1])
         if len(args_a) != 2 or len(args_b) != 2:
             return False
-        return is_types_equals(args_a[0], args_b[0]) and is_types_equals(args_a[1], args_b[1])
+        return _is_types_equals(args_a[0], args_b[0]) and _is_types_equals(args_a[1], args_b[1])
 
     # Handle typing.Dict
     if a.startswith("Typing.") or a.startswith("typing."):
@@ -82,30 +108,41 @@ def gen_id(length: int = 16) -> str:
     """
     if length <= 0:
         raise ValueError("Length must be a positive integer")
-    return ''.join(random.choice('0123456789abcdef') for _ in range(length))
+    return secrets.token_hex((length + 1) // 2)[:length]
 
 
 
+@lru_cache(maxsize=8)
+def _nested_split_tokens(sep: str) -> re.Pattern[str]:
+    """
+    Pattern matching the characters split_with_nested has to look at: brackets and the separator.
+    """
+    return re.compile(f"[\\[\\]{{}}(){re.escape(sep)}]")
+
 def split_with_nested(s: str, sep: str = ",") -> list[str]:
     """
     Split a string by a separator, ignoring separators inside nested structures like [], {}, ().
     Example: "a,[b,[c,d]],e" -> ["a", "[b,[c,d]]", "e"]
     """
+    if not any(bracket in s for bracket in "[]{}()"): # nothing nested, str.split does the same in C
+        parts = s.split(sep)
+        if not parts[-1]: # a trailing separator (or an empty string) does not produce an empty part
+            parts.pop()
+        return [part.strip() for part in parts]
     parts = []
-    current = []
     depth = 0
-    for char in s:
+    last = 0
+    for match in _nested_split_tokens(sep).finditer(s): # only visit brackets and separators
+        i, char = match.start(), match.group()
         if char in "[{(":
             depth += 1
         elif char in "]})":
             depth -= 1
         if char == sep and depth == 0:
-            parts.append(''.join(current).strip())
-            current = []
-        else:
-            current.append(char)
-    if current:
-        parts.append(''.join(current).strip())
+            parts.append(s[last:i].strip())
+            last = i + 1
+    if last < len(s):
+        parts.append(s[last:].strip())
     return parts
 
 
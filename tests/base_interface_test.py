@@ -0,0 +1,229 @@
+import time
+from datetime import datetime
+
+import pytest
+from modular_server_manager.bus import Bus, BusData
+from modular_server_manager.user_interface import BaseInterface
+from modular_server_manager.user_interface.database import (AccessLevel,
+                                                            AccessToken,
+                                                            Database, User)
+
+
+@pytest.fixture
+def bus_network(monkeypatch):
+    # replace the shared memory bus by direct calls: a triggered event is delivered to every other bus,
+    # like the BusDispatcher does between the user interface processes
+    buses : list[Bus] = []
+    bus_init = Bus.__init__
+
+    def init(self, data):
+        bus_init(self, data)
+        buses.append(self)
+
+    def trigger(self, event, timeout=5, **kwargs):
+        for bus in buses:
+            if bus is not self:
+                for callback in bus._Bus__subscribers.get(event.id, []): # type: ignore
+                    callback(timestamp=datetime.now(), **kwargs)
+
+    monkeypatch.setattr(Bus, "__init__", init)
+    monkeypatch.setattr(Bus, "trigger", trigger)
+    return buses
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "data" / "users.db")
+
+def new_interface(db_path : str) -> BaseInterface:
+    bus_data = BusData(None, None, None, None, "test", 8, 64, "test", 1) # type: ignore # never started
+    return BaseInterface(bus_data, db_path)
+
+@pytest.fixture
+def interface(bus_network, db_path):
+    return new_interface(db_path)
+
+
+class TestDatabase:
+    def test_register_commit(self, db_path):
+        database = Database(db_path)
+        now = datetime.now()
+        token = AccessToken.new("alice", datetime.fromtimestamp(now.timestamp() + 3600))
+        database.register_commit(User("alice", "hash", now, now), token)
+
+        access_token, user = database.get_token_and_user(token.token) # type: ignore
+        assert access_token.token == token.token
+        assert user.username == "alice"
+        assert user.access_level == AccessLevel.USER
+
+    def test_get_user_or_none(self, db_path):
+        database = Database(db_path)
+        assert database.get_user_or_none("nobody") is None
+        assert database.get_token_and_user("unknown") is None
+        with pytest.raises(ValueError):
+            database.get_user("nobody")
+
+    def test_login_commit_replaces_token(self, db_path):
+        database = Database(db_path)
+        now = datetime.now()
+        expiration = datetime.fromtimestamp(now.timestamp() + 3600)
+        first = AccessToken.new("alice", expiration)
+        database.register_commit(User("alice", "hash", now, now), first)
+
+        second = AccessToken.new("alice", expiration)
+        database.login_commit(User("alice", "new_hash", now, now, AccessLevel.ADMIN), second)
+
+        assert database.get_token_and_user(first.token) is None
+        _, user = database.get_token_and_user(second.token) # type: ignore
+        assert user.password == "new_hash"
+        assert user.access_level == AccessLevel.ADMIN
+
+
+class TestTokenCache:
+    def test_old_token_rejected_after_login(self, interface):
+        old = interface.register("alice", "password")
+        interface.get_user_info(old.token) # cached
+        new = interface.login("alice", "password")
+
+        with pytest.raises(ValueError):
+            interface.get_user_info(old.token)
+        assert interface.get_user_info(new.token).username == "alice"
+
+    def test_logout(self, interface):
+        token = interface.register("alice", "password")
+        interface.get_user_info(token.token)
+        interface.logout(token.token)
+
+        with pytest.raises(ValueError):
+            interface.get_user_info(token.token)
+
+    def test_delete_user(self, interface):
+        token = interface.register("alice", "password")
+        interface.get_user_info(token.token)
+        interface.delete_user(token.token)
+
+        with pytest.raises(ValueError):
+            interface.get_user_info(token.token)
+
+    def test_access_level_change(self, interface):
+        token = interface.register("alice", "password")
+        assert interface.get_user_info(token.token).access_level == AccessLevel.USER
+        interface.update_user_access("alice", "ADMIN")
+
+        assert interface.get_user_info(token.token).access_level == AccessLevel.ADMIN
+
+    def test_invalidation_during_query_is_not_cached(self, interface):
+        token = interface.register("alice", "password")
+        database = interface._database
+        get_token_and_user = database.get_token_and_user
+
+        def logout_during_query(value):
+            res = get_token_and_user(value)
+            interface.logout(value) # lands between the query and the cache update
+            return res
+
+        database.get_token_and_user = logout_during_query
+        try:
+            interface.get_user_info(token.token) # answered with the row read before the logout
+        finally:
+            del database.get_token_and_user
+
+        with pytest.raises(ValueError):
+            interface.get_user_info(token.token)
+
+    def test_update_password_keeps_other_columns(self, interface):
+        token = interface.register("alice", "password")
+        interface.get_user_info(token.token) # cached with the USER access level
+        # changed by another process, whose invalidation has not arrived yet
+        user = interface._database.get_user("alice")
+        user.access_level = AccessLevel.OPERATOR
+        user.last_login = datetime.fromtimestamp(user.last_login.timestamp() + 60)
+        interface._database.update_user(user)
+        before = interface._database.get_user("alice")
+
+        interface.update_password(token.token, "new_password")
+
+        after = interface._database.get_user("alice")
+        assert after.access_level == AccessLevel.OPERATOR
+        assert after.last_login == before.last_login
+        assert after.password != before.password
+        interface.login("alice", "new_password")
+
+
+class TestTokenCacheAcrossInterfaces:
+    @pytest.fixture
+    def interfaces(self, bus_network, db_path):
+        return new_interface(db_path), new_interface(db_path)
+
+    def test_logout(self, interfaces):
+        first, second = interfaces
+        token = first.register("alice", "password")
+        second.get_user_info(token.token) # cached in the second interface
+        first.logout(token.token)
+
+        with pytest.raises(ValueError):
+            second.get_user_info(token.token)
+
+    def test_access_level_change(self, interfaces):
+        first, second = interfaces
+        token = first.register("alice", "password")
+        assert second.get_user_info(token.token).access_level == AccessLevel.USER
+        first.update_user_access("alice", "ADMIN")
+
+        assert second.get_user_info(token.token).access_level == AccessLevel.ADMIN
+
+    def test_delete_user(self, interfaces):
+        first, second = interfaces
+        token = first.register("alice", "password")
+        second.get_user_info(token.token)
+        first.delete_user(token.token)
+
+        with pytest.raises(ValueError):
+            second.get_user_info(token.token)
+
+
+class TestLoginRateLimit:
+    @pytest.fixture
+    def limited(self, interface):
+        interface.register("alice", "password")
+        interface.LOGIN_MAX_FAILURES = 3
+        interface.LOGIN_FAILURES_WINDOW = 1
+        interface.LOGIN_THROTTLE_DELAY = 0.3
+        return interface
+
+    def fail(self, interface, client, count):
+        for _ in range(count):
+            with pytest.raises(ValueError, match="Invalid password"):
+                interface.login("alice", "wrong", client=client)
+
+    def test_locked_client_refused(self, limited):
+        self.fail(limited, "10.0.0.1", 3)
+        with pytest.raises(ValueError, match="Too many failed login attempts"):
+            limited.login("alice", "password", client="10.0.0.1")
+
+    def test_other_client_allowed(self, limited):
+        self.fail(limited, "10.0.0.1", 3)
+        assert limited.login("alice", "password", client="10.0.0.2").username == "alice"
+
+    def test_unknown_client_only_delayed(self, limited):
+        self.fail(limited, None, 3)
+        start = time.monotonic()
+        assert limited.login("alice", "password").username == "alice"
+        assert time.monotonic() - start >= limited.LOGIN_THROTTLE_DELAY
+
+    def test_window_expires(self, limited):
+        self.fail(limited, "10.0.0.1", 3)
+        time.sleep(limited.LOGIN_FAILURES_WINDOW + 0.1)
+        assert limited.login("alice", "password", client="10.0.0.1").username == "alice"
+
+    def test_stale_clients_are_dropped(self, limited):
+        for client in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+            self.fail(limited, client, 1)
+        time.sleep(limited.LOGIN_FAILURES_WINDOW + 0.1)
+        self.fail(limited, "10.0.0.4", 1)
+        assert list(limited._BaseInterface__login_failures) == [("alice", "10.0.0.4")]
+
+    def test_failures_are_bounded(self, limited):
+        # an unknown client is never refused, so its failures keep being recorded
+        limited.LOGIN_THROTTLE_DELAY = 0
+        self.fail(limited, None, 6)
+        assert len(limited._BaseInterface__login_failures[("alice", None)]) == limited.LOGIN_MAX_FAILURES
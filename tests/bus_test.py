@@ -1,7 +1,7 @@
 import multiprocessing as mp
 import threading as th
-import time
 from datetime import datetime
+from multiprocessing.synchronize import Event as EventType
 from typing import Any, Dict
 
 from gamuLogger import Levels, Logger
@@ -20,17 +20,17 @@ Logger.set_level("stdout", Levels.DEBUG)
 Logger.set_module("Bus.Test")
 
 
-def bus_process1(bus_data : BusData):
+def bus_process1(bus_data : BusData, ready : EventType, done : EventType):
     Logger.info("Starting bus_process1")
     bus = Bus(bus_data)
     bus.start()
     #bus.trigger(Events["SERVER.START"], server_name="TestServer", timestamp=int(datetime.now().timestamp()))
-    time.sleep(2)
+    ready.wait(timeout=5) # wait for bus_process2 to register its handlers
     print(bus.trigger(Events["GET_VERSIONS.MINECRAFT"]))
-    time.sleep(1)
+    done.set()
     bus.stop()
 
-def bus_process2(bus_data : BusData):
+def bus_process2(bus_data : BusData, ready : EventType, done : EventType):
     Logger.info("Starting bus_process2")
     bus = Bus(bus_data)
     def c(timestamp: datetime) -> list[Version]:
@@ -40,17 +40,17 @@ def bus_process2(bus_data : BusData):
     bus.register(Events["GET_VERSIONS.MINECRAFT"], c)
     bus.register(Events["GET_VERSIONS.FORGE"], d)
     bus.start()
-    time.sleep(5)
+    ready.set()
     # bus.trigger(Events["SERVER.STARTING"], server_name="TestServer", timestamp=int(datetime.now().timestamp()))
-    time.sleep(5)
     # bus.trigger(Events["SERVER.STARTED"], server_name="TestServer", timestamp=int(datetime.now().timestamp()))
+    done.wait(timeout=10) # stop as soon as bus_process1 got its answer
     bus.stop()
 
-def bus_thread(bus_data : BusData):
+def bus_thread(bus_data : BusData, done : EventType):
     Logger.info("Starting bus_thread")
     bus = Bus(bus_data)
     bus.start()
-    time.sleep(12)
+    done.wait(timeout=12)
     bus.stop()
 
 def main():
@@ -65,10 +65,13 @@ def main():
     bus_data2 = dispatcher.get_bus_data("bus2")
     bus_data3 = dispatcher.get_bus_data("bus3")
 
+    ready = mp.Event() # set once bus_process2 has registered its handlers
+    done = mp.Event() # set once bus_process1 got the answer, the others can stop
+
     # Start the bus processes
-    bus_process1_process = mp.Process(target=bus_process1, args=(bus_data1, ))
-    bus_process2_process = mp.Process(target=bus_process2, args=(bus_data2, ))
-    bus_thread_process = th.Thread(target=bus_thread, args=(bus_data3, ), daemon=True, name="BusThread")
+    bus_process1_process = mp.Process(target=bus_process1, args=(bus_data1, ready, done))
+    bus_process2_process = mp.Process(target=bus_process2, args=(bus_data2, ready, done))
+    bus_thread_process = th.Thread(target=bus_thread, args=(bus_data3, done), daemon=True, name="BusThread")
     bus_process1_process.start()
     bus_process2_process.start()
     bus_thread_process.start()
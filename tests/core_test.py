@@ -0,0 +1,100 @@
+import os
+
+import pytest
+from modular_server_manager.core import Core
+
+is_path_in_dir = Core._Core__is_path_in_dir # type: ignore
+
+
+@pytest.fixture
+def mc_dir(tmp_path):
+    path = tmp_path / "mc"
+    path.mkdir()
+    return str(path)
+
+@pytest.fixture
+def core(mc_dir):
+    # only the attributes used by the path check are set, no bus or config is needed
+    core = Core.__new__(Core)
+    core._Core__mc_dirs = [mc_dir] # type: ignore
+    core._Core__mc_dirs_real = [os.path.realpath(mc_dir)] # type: ignore
+    return core
+
+
+class TestIsPathInDir:
+    @pytest.mark.parametrize(
+        "path, directory, expected", [
+        ("/srv/mc", "/srv/mc", True),
+        ("/srv/mc/server1", "/srv/mc", True),
+        ("/srv/mc/a/b", "/srv/mc", True),
+        ("/srv/mc-other", "/srv/mc", False),
+        ("/srv/mcserver", "/srv/mc", False),
+        ("/srv", "/srv/mc", False),
+        ("/etc/passwd", "/srv/mc", False),
+    ], ids=["same_dir", "child", "grandchild", "sibling_prefix_dash", "sibling_prefix", "parent", "unrelated"])
+    def test_is_path_in_dir(self, path, directory, expected):
+        assert is_path_in_dir(path, directory) is expected
+
+
+class TestIsServerPathValid:
+    def test_server_in_dir(self, core, mc_dir):
+        assert core._Core__is_server_path_valid(os.path.join(mc_dir, "server1")) is True
+
+    def test_sibling_prefix(self, core, mc_dir):
+        assert core._Core__is_server_path_valid(f"{mc_dir}-other/server1") is False
+
+    def test_dotdot_escape(self, core, mc_dir):
+        assert core._Core__is_server_path_valid(os.path.join(mc_dir, "..", "outside")) is False
+
+    def test_symlink_escape(self, core, mc_dir, tmp_path):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        os.symlink(outside, os.path.join(mc_dir, "link"))
+        assert core._Core__is_server_path_valid(os.path.join(mc_dir, "link", "server1")) is False
+
+    def test_symlink_inside(self, core, mc_dir):
+        os.mkdir(os.path.join(mc_dir, "real"))
+        os.symlink(os.path.join(mc_dir, "real"), os.path.join(mc_dir, "link"))
+        assert core._Core__is_server_path_valid(os.path.join(mc_dir, "link", "server1")) is True
+
+    @pytest.mark.parametrize("server_path", ["", None, 42], ids=["empty", "none", "not_a_string"])
+    def test_invalid_type_or_empty(self, core, server_path):
+        assert core._Core__is_server_path_valid(server_path) is False
+
+
+class FakeConfig(dict):
+    # the subset of JSONConfig used by the rename handler
+    def set(self, key, value):
+        self[key] = value
+
+    def remove(self, key):
+        del self[key]
+
+class FakeBus:
+    def __init__(self):
+        self.triggered = []
+
+    def trigger(self, event, **kwargs):
+        self.triggered.append((event.name, kwargs))
+
+
+class TestServerRename:
+    @pytest.fixture
+    def renaming_core(self):
+        core = Core.__new__(Core)
+        core._srv_config = FakeConfig(server1={"type": "vanilla"}) # type: ignore
+        core._Core__bus = FakeBus() # type: ignore
+        return core
+
+    def test_rename(self, renaming_core):
+        renaming_core.on_server_rename(None, "server1", "server_2")
+        assert dict(renaming_core._srv_config) == {"server_2": {"type": "vanilla"}}
+        assert renaming_core._Core__bus.triggered == [("SERVER.RENAMED", {"server_name": "server1", "new_name": "server_2"})]
+
+    @pytest.mark.parametrize(
+        "new_name", ["my.server", "my server", "", "a" * 17, "../server"],
+        ids=["dot", "space", "empty", "too_long", "path"])
+    def test_rename_invalid_name(self, renaming_core, new_name):
+        renaming_core.on_server_rename(None, "server1", new_name)
+        assert dict(renaming_core._srv_config) == {"server1": {"type": "vanilla"}}
+        assert renaming_core._Core__bus.triggered == []
@@ -1,5 +1,6 @@
 import json
 import os
+import sqlite3
 import subprocess
 import sys
 import time
@@ -12,34 +13,55 @@ BASE_URL = "http://localhost:5000"
 BASE_PATH = os.path.dirname(os.path.abspath(__file__)).replace("\\", "/")
 
 CONFIG_FILE = f"{BASE_PATH}/config.json"
+TEMP_DIR = f"{BASE_PATH}/temp"
+DB_FILE = f"{TEMP_DIR}/server.db"
+
+SERVER_ARGV = [sys.executable, "-m", "modular_server_manager", "--module-level", "all:TRACE"]
+
+SESSION = requests.Session() # keeps the connection to the server alive between requests
 
 
 def login(username, password):
-    return requests.post(f"{BASE_URL}/api/login", json={"username": username, "password": password})
+    return SESSION.post(f"{BASE_URL}/api/login", json={"username": username, "password": password})
 
 def register(username, password):
-    return requests.post(f"{BASE_URL}/api/register", json={"username": username, "password": password})
+    return SESSION.post(f"{BASE_URL}/api/register", json={"username": username, "password": password})
 
 def logout(token):
-    return requests.post(f"{BASE_URL}/api/logout", headers={"Authorization": f"{token}"})
+    return SESSION.post(f"{BASE_URL}/api/logout", headers={"Authorization": f"{token}"})
+
+def wait_ready(server_process : subprocess.Popen, timeout : float = 10.0):
+    """
+    Wait until the server answers HTTP requests (any status code means it is up)
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server_process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server_process.returncode} before being ready")
+        try:
+            SESSION.post(f"{BASE_URL}/api/login", json={}, timeout=0.5)
+            return
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            time.sleep(0.05)
+    raise TimeoutError(f"Server not ready after {timeout} seconds")
 
 
 
 class TestRegister:
-    @pytest.fixture(autouse=True)
-    def setup_and_teardown(self, request : pytest.FixtureRequest):
-        # Setup: Start the server
+    @pytest.fixture(scope="class")
+    def server(self, request : pytest.FixtureRequest):
+        # Setup: Start the server once for the whole class
         name = request.node.name
 
-        db_file = f"{BASE_PATH}/temp/server.{name}.db"
+        db_file = f"{TEMP_DIR}/server.{name}.db"
 
         # Remove the database file if it exists
         if os.path.exists(db_file):
             os.remove(db_file)
 
-        config_file = f"{BASE_PATH}/temp/config.{name}.json"
+        config_file = f"{TEMP_DIR}/config.{name}.json"
         config = {
-            "app_data_path" : f"{BASE_PATH}/temp",
+            "app_data_path" : TEMP_DIR,
             "forge_servers_path" : "${app_data_path}/servers",
             "database_path" : "${app_data_path}/server."+f"{name}.db",
         }
@@ -48,19 +70,25 @@ class TestRegister:
 
 
         server_process = subprocess.Popen(
-            [sys.executable, "-m", "modular_server_manager", "--module-level", "all:TRACE", "-c", config_file, "--log-file", f"{BASE_PATH}/temp/{name}.log:TRACE"],
+            SERVER_ARGV + ["-c", config_file, "--log-file", f"{TEMP_DIR}/{name}.log:TRACE"],
             stdout=sys.stdout,
             stderr=sys.stdout
         )
 
-        time.sleep(2)  # Wait for the server to start
+        wait_ready(server_process)
 
-        yield
+        yield db_file
 
         server_process.terminate()
-        server_process.wait()
+        server_process.wait()  # the process has exited, the database file is released
 
-        time.sleep(1)  # Wait for the server to stop and release the database file
+    @pytest.fixture(autouse=True)
+    def clear_users(self, server : str):
+        # Every test starts with an empty user table, without restarting the server
+        with sqlite3.connect(server) as conn:
+            conn.execute("DELETE FROM access_tokens")
+            conn.execute("DELETE FROM users")
+        conn.close()
 
     def test_register_success(self):  # sourcery skip: class-extract-method
         response = register("testuser", "testpassword")
@@ -95,16 +123,16 @@ class TestRegister:
 
 
 class TestLogin:
-    @pytest.fixture(autouse=True)
+    @pytest.fixture(scope="class", autouse=True)
     def setup_and_teardown(self, request : pytest.FixtureRequest):
         # Setup: Start the server
         name = request.node.name
 
-        if os.path.exists(f"{BASE_PATH}/temp/server.db"):
-            os.remove(f"{BASE_PATH}/temp/server.db")
+        if os.path.exists(DB_FILE):
+            os.remove(DB_FILE)
 
-        server_process = subprocess.Popen([sys.executable, "-m", "modular_server_manager", "--module-level", "all:TRACE", "-c", CONFIG_FILE, "--log-file", f"tests/end_to_end/temp/{name}.log:TRACE"])
-        time.sleep(1)  # Wait for the server to start
+        server_process = subprocess.Popen(SERVER_ARGV + ["-c", CONFIG_FILE, "--log-file", f"tests/end_to_end/temp/{name}.log:TRACE"])
+        wait_ready(server_process)
 
         # create a test user
         register("testuser", "testpassword")
@@ -113,9 +141,7 @@ class TestLogin:
 
         # Teardown: Stop the server
         server_process.terminate()
-        server_process.wait()
-
-        time.sleep(1)  # Wait for the server to stop and release the database file
+        server_process.wait()  # the process has exited, the database file is released
 
     def test_login_success(self):
         response = login("testuser", "testpassword")
@@ -147,26 +173,23 @@ class TestLogin:
 
 
 class TestLogout:
-    @pytest.fixture(autouse=True)
+    @pytest.fixture(scope="class", autouse=True)
     def setup_and_teardown(self, request : pytest.FixtureRequest):
         # Setup: Start the server
         name = request.node.name
 
-        if os.path.exists(f"{BASE_PATH}/temp/server.db"):
-            os.remove(f"{BASE_PATH}/temp/server.db")
+        if os.path.exists(DB_FILE):
+            os.remove(DB_FILE)
 
-        server_process = subprocess.Popen([sys.executable, "-m", "modular_server_manager", "--module-level", "all:TRACE", "-c", CONFIG_FILE, "--log-file", f"tests/end_to_end/temp/{name}.log:TRACE"])
-        time.sleep(1)
-        # Wait for the server to start
+        server_process = subprocess.Popen(SERVER_ARGV + ["-c", CONFIG_FILE, "--log-file", f"tests/end_to_end/temp/{name}.log:TRACE"])
+        wait_ready(server_process)
         # create a test user
         register("testuser", "testpassword")
         yield
 
         # Teardown: Stop the server
         server_process.terminate()
-        server_process.wait()
-
-        time.sleep(1)  # Wait for the server to stop and release the database file
+        server_process.wait()  # the process has exited, the database file is released
 
     def test_logout_success(self):
         # First login to get the token